@@ -1,6 +1,134 @@
+import calendar
+import copy
 import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# ISIN stays text even when all digits; low-cardinality columns load as categoricals
+_BONDS_DTYPES = {
+    'isin': str,
+    'issuer_name': 'category',
+    'issuer_type': 'category',
+    'sector': 'category',
+    'credit_rating': 'category',
+    'status': 'category',
+    'security_type': 'category',
+}
+
+try:
+    # google-re2 matches in time linear in the query length (no backtracking);
+    # every pattern below sticks to syntax both engines accept
+    import re2
+except ImportError:
+    re2 = None
+
+class _Pattern:
+    """
+    Query pattern compiled with re, and also with re2 when it is installed
+    
+    re2 only handles printable ASCII queries: beyond those its whitespace,
+    digit and case-folding rules differ from re's, and routing must not
+    depend on which engine is installed.
+    """
+    
+    def __init__(self, pattern: str):
+        self._re = re.compile(pattern)
+        self._re2 = re2.compile(pattern) if re2 is not None else None
+    
+    def search(self, query: str):
+        if self._re2 is not None and query.isascii() and query.isprintable():
+            return self._re2.search(query)
+        return self._re.search(query)
+
+# Query patterns; case-insensitivity is inline (?i) since re2 has no IGNORECASE flag
+_PAT_ISIN = _Pattern(r'(?i)ISIN\s+([A-Z0-9]+)')
+_PAT_ISIN_ISSUER = _Pattern(r'(?i)(issuances|issued|bonds|by|from)\s+([A-Za-z\s]+)')
+_PAT_ISSUER = _Pattern(r'(?i)(issuances|issued|bonds).+(by|from)\s+([A-Za-z\s]+)')
+_PAT_FILTER = _Pattern(r'(?i)(find|search|filter).+(bonds|debentures)')
+_PAT_MATURITY = _Pattern(r'(?i)(maturing|maturity).+(\d{4})')
+_PAT_YEAR = _Pattern(r'(\d{4})')
+_PAT_CASH_FLOW = _Pattern(r'(?i)(cash\s+flow|schedule).+ISIN\s+([A-Z0-9]+)')
+_PAT_SECURITY = _Pattern(r'(?i)(security|secured).+ISIN\s+([A-Z0-9]+)')
+_PAT_DOCUMENT = _Pattern(r'(?i)(document|doc|offer|trust).+(ISIN|for)\s+([A-Z0-9]+)')
+_PAT_DOCUMENT_ISIN = _Pattern(r'(?i)([A-Z0-9]+)')
+_PAT_DOCUMENT_ISSUER = _Pattern(r'(?i)document.+\s+([A-Za-z\s]+)')
+_PAT_TRUSTEE = _Pattern(r'(?i)(trustee|debenture\s+trustee).+ISIN\s+([A-Z0-9]+)')
+_PAT_LISTING = _Pattern(r'(?i)(listing|listed|exchange|trading).+ISIN\s+([A-Z0-9]+)')
+_PAT_FACE_VALUE = _Pattern(r'(?i)(face\s+value).+ISIN\s+([A-Z0-9]+)')
+_PAT_FACE_VALUE_ISSUER = _Pattern(r'(?i)(face\s+value).+([A-Za-z\s]+)\s+bond')
+
+# Filter criteria patterns used by _filter_bonds
+_PAT_SECURED = _Pattern(r'(?i)secured')
+_PAT_COUPON_ABOVE = _Pattern(r'(?i)coupon.+above\s+(\d+\.?\d*)%')
+_PAT_MATURITY_AFTER = _Pattern(r'(?i)maturity.+after\s+(\d{4})')
+_PAT_RATED = _Pattern(r'(?i)rated\s+([A-Z]+[+-]?)')
+
+# Lowercase keyword -> dispatch flag. Each pattern above can only match if
+# one of its flag's keywords occurs in the query, so process_query collects
+# the flags in one pass and only runs the patterns whose flag is present.
+_KEYWORDS = {
+    'isin': 'isin',
+    'issuances': 'issuer', 'issued': 'issuer', 'bonds': 'issuer',
+    'find': 'filter', 'search': 'filter', 'filter': 'filter',
+    'maturing': 'maturity', 'maturity': 'maturity',
+    'cash': 'cash_flow', 'schedule': 'cash_flow',
+    'security': 'security', 'secured': 'security',
+    'doc': 'document', 'offer': 'document', 'trust': 'document',
+    'trustee': 'trustee',
+    'listing': 'listing', 'listed': 'listing', 'exchange': 'listing', 'trading': 'listing',
+    'face': 'face_value',
+}
+_ALL_FLAGS = frozenset(_KEYWORDS.values())
+
+class LazyRecords:
+    """
+    Read-only sequence of bond records backed by column lists
+    
+    Stands in for DataFrame.to_dict('records') in responses: each record dict
+    is only built when it is indexed or iterated, so callers that just show
+    the response message never pay for materializing the matched rows.
+    """
+    
+    def __init__(self, rows, columns: Dict[str, list]):
+        """
+        Args:
+            rows: Row positions of the records, in order
+            columns: Column name -> list of values for every row of the table
+        """
+        self._rows = rows
+        self._columns = columns
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyRecords(self._rows[index], self._columns)
+        row = self._rows[index]
+        return {column: values[row] for column, values in self._columns.items()}
+    
+    def __iter__(self):
+        for row in self._rows:
+            yield {column: values[row] for column, values in self._columns.items()}
+    
+    def __deepcopy__(self, memo):
+        # Read-only, and every record is built afresh, so a copy can share it
+        return self
+    
+    def __repr__(self) -> str:
+        return f"LazyRecords({len(self)} records)"
+
+def _six_months_before(date: pd.Timestamp) -> pd.Timestamp:
+    """
+    Same result as date - pd.DateOffset(months=6): the day is clamped to the
+    end of a shorter month. Plain replace() on the Timestamp avoids the
+    DateOffset machinery, which dominated the cash flow schedule.
+    """
+    year, month = divmod(date.year * 12 + date.month - 7, 12)
+    month += 1
+    return date.replace(year=year, month=month, day=min(date.day, calendar.monthrange(year, month)[1]))
 
 class BondDirectoryAgent:
     def __init__(self, bonds_database_path: str):
@@ -10,7 +138,39 @@ class BondDirectoryAgent:
         Args:
             bonds_database_path: Path to the bonds database CSV file
         """
-        self.bonds_db = pd.read_csv(bonds_database_path)
+        self.bonds_db = pd.read_csv(
+            bonds_database_path,
+            dtype=_BONDS_DTYPES,
+            parse_dates=['redemption_date']
+        )
+        # Parse dates and numbers once here rather than on every filter call;
+        # coerces any values read_csv could not convert to NaT/NaN
+        self.bonds_db['redemption_date'] = pd.to_datetime(self.bonds_db['redemption_date'], errors='coerce')
+        self.bonds_db['coupon_rate'] = pd.to_numeric(self.bonds_db['coupon_rate'], errors='coerce')
+        # Maturity year per row (0 where the redemption date is unknown) and
+        # year -> row positions for maturity-year lookups
+        self._maturity_year = self.bonds_db['redemption_date'].dt.year.fillna(0).to_numpy(dtype=np.int16)
+        self._rows_by_maturity_year = {
+            int(year): rows
+            for year, rows in pd.Series(self._maturity_year).groupby(self._maturity_year).indices.items()
+            if year
+        }
+        # Column-wise Python lists plus ISIN -> row position, so single-bond
+        # lookups are a dict hit and a few list reads instead of a boolean
+        # mask over the whole table (first row wins on duplicate ISINs)
+        self._cols = {column: self.bonds_db[column].tolist() for column in self.bonds_db.columns}
+        isins = self._cols['isin']
+        self._row_of_isin = {isins[i]: i for i in range(len(isins) - 1, -1, -1)}
+        # Lowercased issuer name -> row positions
+        issuer_lower = self.bonds_db['issuer_name'].str.lower()
+        self._issuer_rows = self.bonds_db.groupby(issuer_lower, sort=False).indices
+        # Lowercased issuer name -> number of active bonds
+        self._active_by_issuer = self.bonds_db['status'].eq('Active').groupby(issuer_lower).sum().to_dict()
+        # Per-row arrays for the _filter_bonds criteria, and the matching row
+        # positions cached per distinct set of criteria
+        self._is_secured = self.bonds_db['security_type'].eq('Secured').to_numpy()
+        self._coupon_rate = self.bonds_db['coupon_rate'].to_numpy(dtype=float)
+        self._filter_rows = lru_cache(maxsize=256)(self._rows_matching_filter)
         self.response_templates = self._load_response_templates()
     
     def _load_response_templates(self) -> Dict[str, str]:
@@ -57,13 +217,22 @@ class BondDirectoryAgent:
         Returns:
             Dictionary containing the response data
         """
+        if query.isascii():
+            query_lower = query.lower()
+            flags = {flag for keyword, flag in _KEYWORDS.items() if keyword in query_lower}
+        else:
+            # Outside ASCII the patterns' case folding matches more than
+            # lower() finds ('İSIN' matches ISIN), so run every check
+            flags = _ALL_FLAGS
+        
+        # Extract the ISIN once; every ISIN-specific branch below works from it
+        isin_match = _PAT_ISIN.search(query) if 'isin' in flags else None
+        isin = isin_match.group(1) if isin_match else None
+        
         # Check for ISIN lookup
-        isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-        if isin_match:
-            isin = isin_match.group(1)
-            
+        if isin is not None:
             # Check if there's also an issuer mentioned
-            issuer_match = re.search(r'(issuances|issued|bonds|by|from)\s+([A-Za-z\s]+)', query, re.IGNORECASE)
+            issuer_match = _PAT_ISIN_ISSUER.search(query)
             if issuer_match:
                 issuer = issuer_match.group(2).strip()
                 return self._check_isin_issuer_match(isin, issuer)
@@ -71,76 +240,61 @@ class BondDirectoryAgent:
             return self._get_isin_details(isin)
         
         # Check for issuer issuances
-        issuer_match = re.search(r'(issuances|issued|bonds).+(by|from)\s+([A-Za-z\s]+)', query, re.IGNORECASE)
-        if issuer_match:
-            issuer = issuer_match.group(3).strip()
-            return self._get_issuer_issuances(issuer)
+        if 'issuer' in flags:
+            issuer_match = _PAT_ISSUER.search(query)
+            if issuer_match:
+                issuer = issuer_match.group(3).strip()
+                return self._get_issuer_issuances(issuer)
         
         # Check for filtered search
-        if re.search(r'(find|search|filter).+(bonds|debentures)', query, re.IGNORECASE):
+        if 'filter' in flags and _PAT_FILTER.search(query):
             return self._filter_bonds(query)
         
-        # Check for maturity date lookup
-        if re.search(r'(maturing|maturity).+(\d{4})', query, re.IGNORECASE):
-            year_match = re.search(r'(\d{4})', query)
-            if year_match:
+        # Check for maturity date lookup; the pattern needs a four-digit year
+        # after the keyword, so queries without any year never run it
+        if 'maturity' in flags:
+            year_match = _PAT_YEAR.search(query)
+            if year_match and _PAT_MATURITY.search(query):
                 year = year_match.group(1)
                 return self._get_bonds_by_maturity_year(year)
         
         # Check for cash flow schedule
-        if re.search(r'(cash\s+flow|schedule).+ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                return self._get_cash_flow_schedule(isin)
+        if 'cash_flow' in flags and isin is not None and _PAT_CASH_FLOW.search(query):
+            return self._get_cash_flow_schedule(isin)
         
         # Check for security details inquiry
-        if re.search(r'(security|secured).+ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                return self._get_security_details(isin)
+        if 'security' in flags and isin is not None and _PAT_SECURITY.search(query):
+            return self._get_security_details(isin)
         
         # Check for document retrieval
-        if re.search(r'(document|doc|offer|trust).+(ISIN|for)\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                return self._get_document_links(isin)
+        if 'document' in flags and _PAT_DOCUMENT.search(query):
+            doc_match = _PAT_DOCUMENT_ISIN.search(query)
+            if doc_match:
+                return self._get_document_links(doc_match.group(1))
             
             # Check if there's an issuer mentioned instead
-            issuer_match = re.search(r'document.+\s+([A-Za-z\s]+)', query, re.IGNORECASE)
+            issuer_match = _PAT_DOCUMENT_ISSUER.search(query)
             if issuer_match:
                 issuer = issuer_match.group(1).strip()
                 return self._get_issuer_documents(issuer)
         
         # Check for debenture trustee inquiry
-        if re.search(r'(trustee|debenture\s+trustee).+ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                return self._get_debenture_trustee(isin)
+        if 'trustee' in flags and isin is not None and _PAT_TRUSTEE.search(query):
+            return self._get_debenture_trustee(isin)
         
         # Check for listing exchange & trading status
-        if re.search(r'(listing|listed|exchange|trading).+ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                return self._get_listing_details(isin)
+        if 'listing' in flags and isin is not None and _PAT_LISTING.search(query):
+            return self._get_listing_details(isin)
         
         # Check for face value inquiry
-        if re.search(r'(face\s+value).+ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE):
-            isin_match = re.search(r'ISIN\s+([A-Z0-9]+)', query, re.IGNORECASE)
-            if isin_match:
-                isin = isin_match.group(1)
-                
-                # Check if there's also an issuer mentioned
-                issuer_match = re.search(r'(face\s+value).+([A-Za-z\s]+)\s+bond', query, re.IGNORECASE)
-                if issuer_match:
-                    issuer = issuer_match.group(2).strip()
-                    return self._check_isin_issuer_match(isin, issuer, 'face_value')
-                
-                return self._get_face_value(isin)
+        if 'face_value' in flags and isin is not None and _PAT_FACE_VALUE.search(query):
+            # Check if there's also an issuer mentioned
+            issuer_match = _PAT_FACE_VALUE_ISSUER.search(query)
+            if issuer_match:
+                issuer = issuer_match.group(2).strip()
+                return self._check_isin_issuer_match(isin, issuer, 'face_value')
+            
+            return self._get_face_value(isin)
         
         # If no specific pattern matches, provide general help
         return {
@@ -157,17 +311,45 @@ class BondDirectoryAgent:
             )
         }
     
+    def process_queries(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of bond directory related queries
+        
+        Each distinct query is dispatched once; repeats within the batch
+        get a deep copy of its response, so no two results share objects.
+        
+        Args:
+            queries: User input queries
+        
+        Returns:
+            Response dictionaries in the same order as the queries
+        """
+        responses = {query: self.process_query(query) for query in dict.fromkeys(queries)}
+        unclaimed = set(responses)
+        results = []
+        for query in queries:
+            if query in unclaimed:
+                unclaimed.discard(query)
+                results.append(responses[query])
+            else:
+                results.append(copy.deepcopy(responses[query]))
+        return results
+    
     def _get_isin_details(self, isin: str) -> Dict[str, Any]:
         """Get details for a specific ISIN"""
-        bond = self.bonds_db[self.bonds_db['isin'] == isin]
+        row = self._row_of_isin.get(isin)
         
-        if bond.empty:
+        if row is None:
             return {
                 'response_type': 'error',
                 'message': self.response_templates['error_isin_not_found'].format(isin=isin)
             }
         
-        bond_data = bond.iloc[0].to_dict()
+        bond_data = {column: values[row] for column, values in self._cols.items()}
+        
+        # redemption_date is parsed at load time; show it as a plain date
+        redemption_date = bond_data.get('redemption_date')
+        redemption_date = redemption_date.date() if pd.notna(redemption_date) else 'N/A'
         
         return {
             'response_type': 'isin_details',
@@ -181,7 +363,7 @@ class BondDirectoryAgent:
                 instrument_name=bond_data.get('instrument_name', 'N/A'),
                 face_value=bond_data.get('face_value', 'N/A'),
                 issue_size=bond_data.get('issue_size', 'N/A'),
-                redemption_date=bond_data.get('redemption_date', 'N/A'),
+                redemption_date=redemption_date,
                 credit_rating=bond_data.get('credit_rating', 'N/A'),
                 listing_details=bond_data.get('listing_details', 'N/A'),
                 documents=bond_data.get('key_documents', 'N/A')
@@ -191,22 +373,30 @@ class BondDirectoryAgent:
     
     def _get_issuer_issuances(self, issuer: str) -> Dict[str, Any]:
         """Get all issuances by a specific issuer"""
-        bonds = self.bonds_db[self.bonds_db['issuer_name'].str.contains(issuer, case=False, na=False)]
+        issuer_lower = issuer.lower()
+        matching_names = [name for name in self._issuer_rows if issuer_lower in name]
         
-        if bonds.empty:
+        if not matching_names:
             return {
                 'response_type': 'error',
                 'message': self.response_templates['error_issuer_not_found'].format(issuer=issuer)
             }
         
-        total_bonds = len(bonds)
-        active_bonds = len(bonds[bonds['status'] == 'Active'])
+        # Keep the table order of the matched rows
+        rows = np.sort(np.concatenate([self._issuer_rows[name] for name in matching_names]))
+        bonds = self.bonds_db.iloc[rows]
+        
+        total_bonds = len(rows)
+        active_bonds = sum(self._active_by_issuer[name] for name in matching_names)
         matured_bonds = total_bonds - active_bonds
         
-        # Create table of ISINs
-        isins_table = ""
-        for _, bond in bonds.iterrows():
-            isins_table += f"{bond['isin']} | {bond['coupon_rate']}% | {bond['redemption_date']} | ₹{bond['face_value']} | {bond['credit_rating']} | {bond['issue_size']} cr\n"
+        # Create table of ISINs as one vectorized string build; missing
+        # values render as 'nan' like they did with per-row f-strings
+        cols = bonds[['isin', 'coupon_rate', 'redemption_date', 'face_value', 'credit_rating', 'issue_size']].astype(str).fillna('nan')
+        isins_table = (
+            cols['isin'] + ' | ' + cols['coupon_rate'] + '% | ' + cols['redemption_date']
+            + ' | ₹' + cols['face_value'] + ' | ' + cols['credit_rating'] + ' | ' + cols['issue_size'] + ' cr\n'
+        ).str.cat()
         
         return {
             'response_type': 'issuer_issuances',
@@ -218,39 +408,45 @@ class BondDirectoryAgent:
                 matured_bonds=matured_bonds,
                 isins_table=isins_table
             ),
-            'data': bonds.to_dict('records')
+            'data': LazyRecords(rows, self._cols)
         }
     
+    def _parse_filter(self, query: str) -> Tuple[bool, Optional[float], Optional[int], Optional[str]]:
+        """Extract the (secured, min_rate, min_year, rating) filter criteria from a query"""
+        rate_match = _PAT_COUPON_ABOVE.search(query)
+        year_match = _PAT_MATURITY_AFTER.search(query)
+        rating_match = _PAT_RATED.search(query)
+        return (
+            _PAT_SECURED.search(query) is not None,
+            float(rate_match.group(1)) if rate_match else None,
+            int(year_match.group(1)) if year_match else None,
+            rating_match.group(1) if rating_match else None
+        )
+    
+    def _rows_matching_filter(self, secured: bool, min_rate: Optional[float],
+                              min_year: Optional[int], rating: Optional[str]) -> np.ndarray:
+        """Get the row positions of the bonds meeting all the given filter criteria"""
+        mask = np.ones(len(self.bonds_db), dtype=bool)
+        if secured:
+            mask &= self._is_secured
+        if min_rate is not None:
+            mask &= self._coupon_rate > min_rate
+        if min_year is not None:
+            mask &= self._maturity_year > min_year
+        # Filter by credit rating if specified
+        if rating is not None:
+            mask &= self.bonds_db['credit_rating'].str.contains(rating, na=False).to_numpy(dtype=bool)
+        
+        rows = np.flatnonzero(mask)
+        # Shared by every later query with the same criteria
+        rows.flags.writeable = False
+        return rows
+    
     def _filter_bonds(self, query: str) -> Dict[str, Any]:
         """Filter bonds based on query criteria"""
-        filtered_bonds = self.bonds_db.copy()
-        
-        # Apply filters based on query
-        if re.search(r'secured', query, re.IGNORECASE):
-            filtered_bonds = filtered_bonds[filtered_bonds['security_type'] == 'Secured']
-        
-        if re.search(r'coupon.+above\s+(\d+\.?\d*)%', query, re.IGNORECASE):
-            rate_match = re.search(r'coupon.+above\s+(\d+\.?\d*)%', query, re.IGNORECASE)
-            if rate_match:
-                min_rate = float(rate_match.group(1))
-                filtered_bonds = filtered_bonds[filtered_bonds['coupon_rate'] > min_rate]
-        
-        if re.search(r'maturity.+after\s+(\d{4})', query, re.IGNORECASE):
-            year_match = re.search(r'maturity.+after\s+(\d{4})', query, re.IGNORECASE)
-            if year_match:
-                year = int(year_match.group(1))
-                # Convert redemption_date to datetime for comparison
-                filtered_bonds['redemption_date'] = pd.to_datetime(filtered_bonds['redemption_date'], errors='coerce')
-                filtered_bonds = filtered_bonds[filtered_bonds['redemption_date'].dt.year > year]
-        
-        # Filter by credit rating if specified
-        if re.search(r'rated\s+([A-Z]+[+-]?)', query, re.IGNORECASE):
-            rating_match = re.search(r'rated\s+([A-Z]+[+-]?)', query, re.IGNORECASE)
-            if rating_match:
-                rating = rating_match.group(1)
-                filtered_bonds = filtered_bonds[filtered_bonds['credit_rating'].str.contains(rating, na=False)]
+        rows = self._filter_rows(*self._parse_filter(query))
         
-        count = len(filtered_bonds)
+        count = len(rows)
         
         if count == 0:
             return {
@@ -259,15 +455,14 @@ class BondDirectoryAgent:
             }
         
         # Create preview of filtered bonds
-        bonds_preview = ""
-        for _, bond in filtered_bonds.head(5).iterrows():
-            bonds_preview += (
-                f"● ISIN: {bond['isin']}\n"
-                f"● Issuer: {bond['issuer_name']}\n"
-                f"● Coupon Rate: {bond['coupon_rate']}%\n"
-                f"● Redemption Date: {bond['redemption_date']}\n"
-                f"● Security: {bond['security_type']}\n\n"
-            )
+        cols = self.bonds_db.iloc[rows[:5]][['isin', 'issuer_name', 'coupon_rate', 'redemption_date', 'security_type']].astype(str).fillna('nan')
+        bonds_preview = (
+            "● ISIN: " + cols['isin'] + "\n"
+            "● Issuer: " + cols['issuer_name'] + "\n"
+            "● Coupon Rate: " + cols['coupon_rate'] + "%\n"
+            "● Redemption Date: " + cols['redemption_date'] + "\n"
+            "● Security: " + cols['security_type'] + "\n\n"
+        ).str.cat()
         
         if count > 5:
             bonds_preview += f"... and {count - 5} more bonds.\n"
@@ -279,4 +474,88 @@ class BondDirectoryAgent:
                 count=count,
                 bonds_preview=bonds_preview
             ),
-            'data': filtered_bonds.to_dict('records')
+            'data': LazyRecords(rows, self._cols)
+        }
+    
+    def _get_bonds_by_maturity_year(self, year: str) -> Dict[str, Any]:
+        """Get bonds maturing in a specific year"""
+        rows = self._rows_by_maturity_year.get(int(year), [])
+        
+        count = len(rows)
+        
+        if count == 0:
+            return {
+                'response_type': 'no_results',
+                'message': f"No bonds found maturing in {year}."
+            }
+        
+        # Create list of maturing bonds
+        isins, issuers, dates = self._cols['isin'], self._cols['issuer_name'], self._cols['redemption_date']
+        bonds_list = "".join(
+            f"● {isins[row]} | {issuers[row]} | {dates[row].strftime('%d-%m-%Y')}\n"
+            for row in rows[:10]
+        )
+        
+        if count > 10:
+            bonds_list += f"\n... and {count - 10} more bonds maturing in {year}."
+        
+        return {
+            'response_type': 'maturity_bonds',
+            'year': year,
+            'count': count,
+            'message': f"Found {count} bonds maturing in {year}:\n\n{bonds_list}",
+            'data': LazyRecords(rows, self._cols)
+        }
+    
+    def _get_cash_flow_schedule(self, isin: str) -> Dict[str, Any]:
+        """Get cash flow schedule for a specific ISIN"""
+        # In a real implementation, this would fetch from a cash flow database
+        # For this demo, we'll create a simplified example
+        row = self._row_of_isin.get(isin)
+        
+        if row is None:
+            return {
+                'response_type': 'error',
+                'message': self.response_templates['error_isin_not_found'].format(isin=isin)
+            }
+        
+        # Generate synthetic cash flow schedule based on bond data
+        redemption_date = self._cols['redemption_date'][row]
+        coupon_rate = self._cols['coupon_rate'][row]
+        
+        # Create cash flow schedule with semi-annual payments
+        schedule = []
+        current_date = redemption_date
+        
+        # Add principal payment
+        schedule.append({
+            'date': current_date.strftime('%d-%m-%Y'),
+            'type': 'Principal + Interest'
+        })
+        
+        # Add interest payments (semi-annual), stepping back from the previous
+        # date each time so month-end clamping carries forward as before
+        now = pd.Timestamp.now()
+        for i in range(1, 6):  # Up to 3 years of payments
+            current_date = _six_months_before(current_date)
+            if current_date < now:
+                break
+                
+            schedule.append({
+                'date': current_date.strftime('%d-%m-%Y'),
+                'type': 'Interest Payment'
+            })
+        
+        schedule.reverse()  # Sort chronologically
+        
+        # Format the schedule as a table
+        schedule_table = "Date | Type\n-----|-----\n" + "".join(
+            f"{payment['date']} | {payment['type']}\n" for payment in schedule
+        )
+        
+        return {
+            'response_type': 'cash_flow_schedule',
+            'isin': isin,
+            'message': f"Cash flow schedule for ISIN {isin}:\n\n{schedule_table}",
+            'data': schedule
+        }
@@ -1,7 +1,58 @@
+import copy
 import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Tuple
 
+# Issuer and rating load as categoricals
+_FINDER_DTYPES = {
+    'issuer': 'category',
+    'rating': 'category',
+}
+
+# Query patterns
+_PAT_GENERAL = re.compile(r'(show|what).+(available|bonds).+(bond\s+finder)', re.IGNORECASE)
+_PAT_PLATFORM = re.compile(r'(where|which platform).+(buy|purchase|find).+from\s+([A-Za-z\s]+)', re.IGNORECASE)
+_PAT_YIELD = re.compile(r'(yield|bonds).+(more|greater|higher|above)\s+than\s+(\d+\.?\d*)', re.IGNORECASE)
+_PAT_BEST_YIELD = re.compile(r'(best|highest|maximum).+(yield|return)', re.IGNORECASE)
+_PAT_TERM = re.compile(r'(\d+)[\s-]year', re.IGNORECASE)
+_PAT_RATING = re.compile(r'(rating|rated).+(of|as|with)\s+([A-Z]+[+-]?)', re.IGNORECASE)
+
+# The only non-ASCII characters re's IGNORECASE matches to ASCII letters;
+# mapping them first keeps the lowercase keyword tests in _dispatch_query
+# from missing queries such as 'İSIN' that the patterns match
+_ASCII_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', '\u212a': 'k'})
+
+class LazyRecords:
+    """
+    Copy of LazyRecords in bond-directory-agent.py; the agent scripts are
+    standalone and cannot import one another
+    """
+    
+    def __init__(self, rows, columns: Dict[str, list]):
+        self._rows = rows
+        self._columns = columns
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyRecords(self._rows[index], self._columns)
+        row = self._rows[index]
+        return {column: values[row] for column, values in self._columns.items()}
+    
+    def __iter__(self):
+        for row in self._rows:
+            yield {column: values[row] for column, values in self._columns.items()}
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __repr__(self) -> str:
+        return f"LazyRecords({len(self)} records)"
+
 class BondFinderAgent:
     def __init__(self, bond_finder_database_path: str):
         """
@@ -10,9 +61,40 @@ class BondFinderAgent:
         Args:
             bond_finder_database_path: Path to the bond finder database CSV file
         """
-        self.finder_db = pd.read_csv(bond_finder_database_path)
+        self.finder_db = pd.read_csv(bond_finder_database_path, dtype=_FINDER_DTYPES)
         self.platforms = ['SMEST', 'FixedIncome']  # Currently tied up with only these two
         self.response_templates = self._load_response_templates()
+        
+        # Sample bonds from different issuers shown by _get_general_info
+        self._sample_bonds = self.finder_db.drop_duplicates(subset=['issuer']).head(5)
+        
+        # Column-wise Python lists backing the LazyRecords returned as response data
+        self._cols = {column: self.finder_db[column].tolist() for column in self.finder_db.columns}
+        
+        # Lowercased issuer name -> (lowest yield_min, highest yield_max)
+        issuer_lower = self.finder_db['issuer'].str.lower()
+        yield_range = self.finder_db.groupby(issuer_lower, sort=False).agg({'yield_min': 'min', 'yield_max': 'max'})
+        self._yield_range_by_issuer = dict(zip(
+            yield_range.index, zip(yield_range['yield_min'].to_numpy(), yield_range['yield_max'].to_numpy())
+        ))
+        # Rating -> row positions; rating searches test the few distinct
+        # ratings and gather their rows instead of scanning the column
+        self._rating_rows = self.finder_db.groupby('rating', sort=False, observed=True).indices
+        
+        # Issuer -> platforms carrying at least one of its bonds, computed once
+        # with a single groupby instead of a table scan per formatted row
+        platform_columns = [f'available_on_{platform.lower()}' for platform in self.platforms]
+        availability = self.finder_db.groupby('issuer')[platform_columns].any()
+        self._platforms_by_issuer = {
+            issuer: [platform for platform, available in zip(self.platforms, flags) if available]
+            for issuer, flags in zip(availability.index, availability.to_numpy())
+        }
+        
+        # Responses per exact query text; the table is not modified after
+        # loading, but the templates may be, and the cache is dropped when
+        # they no longer match the ones its messages were built from
+        self._cached_dispatch = lru_cache(maxsize=1024)(self._dispatch_query)
+        self._cached_templates = tuple(self.response_templates.items())
     
     def _load_response_templates(self) -> Dict[str, str]:
         """Load templates for different types of responses"""
@@ -43,40 +125,59 @@ class BondFinderAgent:
         """
         Process a bond finder related query
         
+        Responses are cached per query text, and each call gets a deep copy
+        of the cached response. Changes to response_templates take effect on
+        the next call.
+        
         Args:
             query: User's input query
             
         Returns:
             Dictionary containing the response data
         """
+        templates = tuple(self.response_templates.items())
+        if templates != self._cached_templates:
+            self._cached_dispatch.cache_clear()
+            self._cached_templates = templates
+        return copy.deepcopy(self._cached_dispatch(query))
+    
+    def _dispatch_query(self, query: str) -> Dict[str, Any]:
+        """Route a query to the handler for its pattern, without caching"""
+        # Each check below first tests for a keyword its pattern cannot match
+        # without, so most queries skip most of the regex work
+        query_lower = query.lower() if query.isascii() else query.translate(_ASCII_FOLD).lower()
+        
         # Check for general inquiry
-        if re.search(r'(show|what).+(available|bonds).+(bond\s+finder)', query, re.IGNORECASE):
+        if 'finder' in query_lower and _PAT_GENERAL.search(query):
             return self._get_general_info()
         
         # Check for platform availability
-        issuer_match = re.search(r'(where|which platform).+(buy|purchase|find).+from\s+([A-Za-z\s]+)', query, re.IGNORECASE)
-        if issuer_match:
-            issuer = issuer_match.group(3).strip()
-            return self._get_platform_availability(issuer)
+        if 'from' in query_lower:
+            issuer_match = _PAT_PLATFORM.search(query)
+            if issuer_match:
+                issuer = issuer_match.group(3).strip()
+                return self._get_platform_availability(issuer)
         
         # Check for yield-based search
-        yield_match = re.search(r'(yield|bonds).+(more|greater|higher|above)\s+than\s+(\d+\.?\d*)', query, re.IGNORECASE)
-        if yield_match:
-            min_yield = float(yield_match.group(3))
-            return self._get_bonds_by_yield(min_yield)
+        if 'than' in query_lower:
+            yield_match = _PAT_YIELD.search(query)
+            if yield_match:
+                min_yield = float(yield_match.group(3))
+                return self._get_bonds_by_yield(min_yield)
         
         # Check for best yield comparison
-        if re.search(r'(best|highest|maximum).+(yield|return)', query, re.IGNORECASE):
+        if ('yield' in query_lower or 'return' in query_lower) and _PAT_BEST_YIELD.search(query):
             # Check if there's a term specified
-            term_match = re.search(r'(\d+)[\s-]year', query, re.IGNORECASE)
+            term_match = _PAT_TERM.search(query) if 'year' in query_lower else None
             term = int(term_match.group(1)) if term_match else None
             return self._get_best_yield_comparison(term)
         
         # Check for credit rating-based search
-        rating_match = re.search(r'(rating|rated).+(of|as|with)\s+([A-Z]+[+-]?)', query, re.IGNORECASE)
-        if rating_match:
-            rating = rating_match.group(3).upper()
-            return self._get_bonds_by_rating(rating)
+        if 'rating' in query_lower or 'rated' in query_lower:
+            rating_match = _PAT_RATING.search(query)
+            if rating_match:
+                rating = rating_match.group(3).upper()
+                return self._get_bonds_by_rating(rating)
         
         # If no specific pattern matches, provide general help
         return {
@@ -95,20 +196,15 @@ class BondFinderAgent:
     def _get_general_info(self) -> Dict[str, Any]:
         """Get general information about available bonds"""
         # Get a sample of bonds from different issuers
-        sample_bonds = self.finder_db.drop_duplicates(subset=['issuer']).head(5)
+        sample_bonds = self._sample_bonds
         
         # Format as a table
-        bonds_table = ""
-        for _, bond in sample_bonds.iterrows():
-            platforms = self._get_platforms_for_issuer(bond['issuer'])
-            yield_range = f"{bond['yield_min']}%-{bond['yield_max']}%"
-            bonds_table += f"{bond['issuer']} | {
-            # Format as a table
-        bonds_table = ""
-        for _, bond in sample_bonds.iterrows():
-            platforms = self._get_platforms_for_issuer(bond['issuer'])
-            yield_range = f"{bond['yield_min']}%-{bond['yield_max']}%"
-            bonds_table += f"{bond['issuer']} | {bond['rating']} | {yield_range} | {', '.join(platforms)}\n"
+        bonds_table = "".join(
+            f"{issuer} | {rating} | {yield_min}%-{yield_max}% | {', '.join(self._platforms_by_issuer.get(issuer, []))}\n"
+            for issuer, rating, yield_min, yield_max in zip(
+                sample_bonds['issuer'], sample_bonds['rating'], sample_bonds['yield_min'], sample_bonds['yield_max']
+            )
+        )
         
         return {
             'response_type': 'general_info',
@@ -118,9 +214,10 @@ class BondFinderAgent:
     
     def _get_platform_availability(self, issuer: str) -> Dict[str, Any]:
         """Get platforms where bonds from a specific issuer are available"""
-        issuer_bonds = self.finder_db[self.finder_db['issuer'].str.contains(issuer, case=False, na=False)]
+        issuer_lower = issuer.lower()
+        matching_names = [name for name in self._yield_range_by_issuer if issuer_lower in name]
         
-        if issuer_bonds.empty:
+        if not matching_names:
             return {
                 'response_type': 'error',
                 'message': self.response_templates['error_issuer_not_found'].format(issuer=issuer)
@@ -128,9 +225,10 @@ class BondFinderAgent:
         
         platforms = self._get_platforms_for_issuer(issuer)
         
-        # Calculate yield range
-        min_yield = issuer_bonds['yield_min'].min()
-        max_yield = issuer_bonds['yield_max'].max()
+        # Calculate yield range; fmin/fmax skip NaN like Series.min/max
+        ranges = [self._yield_range_by_issuer[name] for name in matching_names]
+        min_yield = np.fmin.reduce([low for low, _ in ranges])
+        max_yield = np.fmax.reduce([high for _, high in ranges])
         yield_range = f"{min_yield}%-{max_yield}%"
         
         return {
@@ -151,23 +249,25 @@ class BondFinderAgent:
     def _get_bonds_by_yield(self, min_yield: float) -> Dict[str, Any]:
         """Get bonds with yield above a specific threshold"""
         # Filter bonds with yield_max greater than min_yield
-        high_yield_bonds = self.finder_db[self.finder_db['yield_max'] > min_yield]
+        rows = np.flatnonzero(self.finder_db['yield_max'].to_numpy() > min_yield)
         
-        if high_yield_bonds.empty:
+        if len(rows) == 0:
             return {
                 'response_type': 'no_results',
                 'message': f"No bonds found with yield above {min_yield}%."
             }
         
         # Format as a table
-        bonds_table = ""
-        for _, bond in high_yield_bonds.head(10).iterrows():
-            platforms = self._get_platforms_for_issuer(bond['issuer'])
-            yield_range = f"{bond['yield_min']}%-{bond['yield_max']}%"
-            bonds_table += f"{bond['issuer']} | {bond['rating']} | {yield_range} | {', '.join(platforms)}\n"
+        top_bonds = self.finder_db.iloc[rows[:10]]
+        bonds_table = "".join(
+            f"{issuer} | {rating} | {yield_min}%-{yield_max}% | {', '.join(self._platforms_by_issuer.get(issuer, []))}\n"
+            for issuer, rating, yield_min, yield_max in zip(
+                top_bonds['issuer'], top_bonds['rating'], top_bonds['yield_min'], top_bonds['yield_max']
+            )
+        )
         
-        if len(high_yield_bonds) > 10:
-            bonds_table += f"\n... and {len(high_yield_bonds) - 10} more bonds."
+        if len(rows) > 10:
+            bonds_table += f"\n... and {len(rows) - 10} more bonds."
         
         return {
             'response_type': 'yield_based_search',
@@ -176,27 +276,29 @@ class BondFinderAgent:
                 min_yield=min_yield,
                 bonds_table=bonds_table
             ),
-            'data': high_yield_bonds.to_dict('records')
+            'data': LazyRecords(rows, self._cols)
         }
     
     def _get_best_yield_comparison(self, term: int = None) -> Dict[str, Any]:
         """Get platform offering the best yield for a specific term"""
-        filtered_bonds = self.finder_db.copy()
+        # Only the yield column is filtered; the winning row is then read
+        # from the full table by its label
+        yields = self.finder_db['yield_max']
         
         # Filter by term if specified
         if term is not None:
             # This would require a term/duration column in the database
             # For now, we'll simulate this filtering
-            filtered_bonds = filtered_bonds[filtered_bonds['term_years'] == term]
+            yields = yields[self.finder_db['term_years'] == term]
         
-        if filtered_bonds.empty:
+        if yields.empty:
             return {
                 'response_type': 'no_results',
                 'message': f"No bonds found{' for ' + str(term) + '-year term' if term else ''}."
             }
         
         # Find the bond with the highest yield
-        best_bond = filtered_bonds.loc[filtered_bonds['yield_max'].idxmax()]
+        best_bond = self.finder_db.loc[yields.idxmax()]
         platforms = self._get_platforms_for_issuer(best_bond['issuer'])
         
         # Determine which platform has this bond with the highest yield
@@ -224,7 +326,9 @@ class BondFinderAgent:
         """Get bonds with a specific credit rating"""
         # Filter bonds by rating
         # This would handle ratings like "AA+" or "A-"
-        rating_bonds = self.finder_db[self.finder_db['rating'].str.contains(rating, regex=False)]
+        matching_ratings = [name for name in self._rating_rows if rating in name]
+        rows = np.sort(np.concatenate([self._rating_rows[name] for name in matching_ratings])) if matching_ratings else []
+        rating_bonds = self.finder_db.iloc[rows]
         
         if rating_bonds.empty:
             return {
@@ -233,12 +337,14 @@ class BondFinderAgent:
             }
         
         # Format as a table
-        bonds_table = ""
-        for _, bond in rating_bonds.head(10).iterrows():
-            platforms = self._get_platforms_for_issuer(bond['issuer'])
-            yield_range = f"{bond['yield_min']}%-{bond['yield_max']}%"
-            maturity = bond.get('maturity_date', 'N/A')
-            bonds_table += f"{bond['issuer']} | {bond['rating']} | {yield_range} | {maturity} | {', '.join(platforms)}\n"
+        top_bonds = rating_bonds.head(10)
+        maturities = top_bonds['maturity_date'] if 'maturity_date' in top_bonds else ['N/A'] * len(top_bonds)
+        bonds_table = "".join(
+            f"{issuer} | {rating} | {yield_min}%-{yield_max}% | {maturity} | {', '.join(self._platforms_by_issuer.get(issuer, []))}\n"
+            for issuer, rating, yield_min, yield_max, maturity in zip(
+                top_bonds['issuer'], top_bonds['rating'], top_bonds['yield_min'], top_bonds['yield_max'], maturities
+            )
+        )
         
         if len(rating_bonds) > 10:
             bonds_table += f"\n... and {len(rating_bonds) - 10} more bonds."
@@ -247,18 +353,11 @@ class BondFinderAgent:
             'response_type': 'rating_based_search',
             'rating': rating,
             'message': f"Bonds with rating {rating}:\n\nIssuer | Rating | Yield | Maturity | Available at\n-------|--------|-------|----------|------------\n{bonds_table}",
-            'data': rating_bonds.to_dict('records')
+            'data': LazyRecords(rows, self._cols)
         }
     
     def _get_platforms_for_issuer(self, issuer: str) -> List[str]:
         """Get platforms where bonds from a specific issuer are available"""
-        issuer_bonds = self.finder_db[self.finder_db['issuer'] == issuer]
-        platforms = []
-        
         # In a real implementation, this would check the platform availability
         # For this demo, we'll just simulate the availability
-        for platform in self.platforms:
-            if any(issuer_bonds[f'available_on_{platform.lower()}']):
-                platforms.append(platform)
-        
-        return platforms
+        return list(self._platforms_by_issuer.get(issuer, []))
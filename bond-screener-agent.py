@@ -1,7 +1,34 @@
 import re
+from functools import lru_cache
 import pandas as pd
 from typing import Dict, List, Any, Optional
 
+# Query patterns
+_PAT_SUMMARY = re.compile(r'(summary|information|about)\s+(for|about|on)\s+', re.IGNORECASE)
+# Matches "(what|get|show) ... (is|the) <metric>" within a line, anchored at the
+# first what/get/show of the line: if the rest fails from there it fails from
+# any later one too, so the lookahead-and-backreference (an atomic group)
+# stops re from retrying the greedy .+ at every later start, which made
+# non-matching queries quadratic. Groups 2 and 3 are as in the plain form.
+_PAT_METRIC = re.compile(r'(?m)^(?=(.*?(?:what|get|show)))\1.+(is|the)\s+(EPS|current ratio|debt[/\\]equity|debt[/\\]EBITDA|interest coverage|operating cashflow|ROE|ROA)', re.IGNORECASE)
+_PAT_COMPARE = re.compile(r'compare\s+(EPS|current ratio|debt[/\\]equity|debt[/\\]EBITDA|interest coverage|operating cashflow|ROE|ROA).+(\w+).+(\w+)', re.IGNORECASE)
+_PAT_PROS_CONS = re.compile(r'(pros|cons|strengths|weaknesses)', re.IGNORECASE)
+_PAT_LENDERS = re.compile(r'(lenders|lent|borrowed|loan)', re.IGNORECASE)
+_PAT_NEWS = re.compile(r'(news|recent|updates|articles)', re.IGNORECASE)
+
+# Company name patterns tried in order by _extract_company_name, each with
+# the group holding the name and a plain keyword pattern that must match for
+# it to match. The lazy name group makes a failing search rescan the query
+# from every start position, so the linear keyword check runs first.
+_PAT_COMPANY_SUFFIX = re.compile(r'company|limited|ltd', re.IGNORECASE)
+_PAT_COMPANY_CONTEXT = re.compile(r'rating|EPS|sector|industry', re.IGNORECASE)
+_COMPANY_PATTERNS = [
+    (re.compile(r'(for|about|on)\s+([A-Za-z\s]+?)\s+(company|limited|ltd)', re.IGNORECASE), 2, _PAT_COMPANY_SUFFIX),
+    (re.compile(r'([A-Za-z\s]+?)\s+(company|limited|ltd)', re.IGNORECASE), 1, _PAT_COMPANY_SUFFIX),
+    (re.compile(r'([A-Za-z\s]+?)\s+(rating|EPS|sector|industry)', re.IGNORECASE), 1, _PAT_COMPANY_CONTEXT),
+]
+_PAT_COMPANY_LIST = re.compile(r'([A-Za-z\s]+?)\s+(company|limited|ltd|and|with|to)', re.IGNORECASE)
+
 class BondScreenerAgent:
     def __init__(self, company_database_path: str, financial_metrics_path: str, news_database_path: str):
         """
@@ -15,6 +42,15 @@ class BondScreenerAgent:
         self.company_db = pd.read_csv(company_database_path)
         self.financial_metrics_db = pd.read_csv(financial_metrics_path)
         self.news_db = pd.read_csv(news_database_path)
+        # Lowercased company names joined with NUL into one string, so checking
+        # a candidate name is a single substring search rather than a pandas
+        # regex scan of the column per candidate; the separator keeps a match
+        # from spanning two names
+        names = self.company_db['company_name'].dropna().str.lower().tolist()
+        self._company_names_lower = '\0'.join(names) if names else None
+        # Extracted company name per exact query text; the company table is
+        # not modified after loading
+        self._cached_company_name = lru_cache(maxsize=1024)(self._extract_company_name)
         self.response_templates = self._load_response_templates()
     
     def _load_response_templates(self) -> Dict[str, str]:
@@ -71,21 +107,21 @@ class BondScreenerAgent:
             Dictionary containing the response data
         """
         # Extract company name from query
-        company_name = self._extract_company_name(query)
+        company_name = self._cached_company_name(query)
         
         # Check for company summary request
-        if re.search(r'(summary|information|about)\s+(for|about|on)\s+', query, re.IGNORECASE):
+        if _PAT_SUMMARY.search(query):
             if company_name:
                 return self._get_company_summary(company_name)
         
         # Check for specific metric request
-        metric_match = re.search(r'(what|get|show).+(is|the)\s+(EPS|current ratio|debt[/\\]equity|debt[/\\]EBITDA|interest coverage|operating cashflow|ROE|ROA)', query, re.IGNORECASE)
-        if metric_match and company_name:
+        metric_match = _PAT_METRIC.search(query) if company_name else None
+        if metric_match:
             metric = metric_match.group(3)
             return self._get_company_metric(company_name, metric)
         
         # Check for metric comparison request
-        compare_match = re.search(r'compare\s+(EPS|current ratio|debt[/\\]equity|debt[/\\]EBITDA|interest coverage|operating cashflow|ROE|ROA).+(\w+).+(\w+)', query, re.IGNORECASE)
+        compare_match = _PAT_COMPARE.search(query)
         if compare_match:
             metric = compare_match.group(1)
             companies = self._extract_multiple_companies(query)
@@ -93,15 +129,15 @@ class BondScreenerAgent:
                 return self._compare_company_metrics(companies, metric)
         
         # Check for pros and cons request
-        if re.search(r'(pros|cons|strengths|weaknesses)', query, re.IGNORECASE) and company_name:
+        if _PAT_PROS_CONS.search(query) and company_name:
             return self._get_pros_cons(company_name)
         
         # Check for lenders request
-        if re.search(r'(lenders|lent|borrowed|loan)', query, re.IGNORECASE) and company_name:
+        if _PAT_LENDERS.search(query) and company_name:
             return self._get_lenders(company_name)
         
         # Check for news request
-        if re.search(r'(news|recent|updates|articles)', query, re.IGNORECASE) and company_name:
+        if _PAT_NEWS.search(query) and company_name:
             return self._get_recent_news(company_name)
         
         # If company name found but no specific request, return summary
@@ -123,24 +159,26 @@ class BondScreenerAgent:
             )
         }
     
+    def _is_known_company(self, name: str) -> bool:
+        """Check whether name occurs, ignoring case, within any company name in the database"""
+        if self._company_names_lower is None or '\0' in name:
+            return False
+        return name.lower() in self._company_names_lower
+    
     def _extract_company_name(self, query: str) -> Optional[str]:
         """Extract company name from query"""
         # Try to find company name patterns
-        patterns = [
-            r'(for|about|on)\s+([A-Za-z\s]+?)\s+(company|limited|ltd)',
-            r'([A-Za-z\s]+?)\s+(company|limited|ltd)',
-            r'([A-Za-z\s]+?)\s+(rating|EPS|sector|industry)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern, group, keywords in _COMPANY_PATTERNS:
+            if not keywords.search(query):
+                continue
+            match = pattern.search(query)
             if match:
                 # Get the company name from the appropriate capture group
-                company_name = match.group(2) if 'for|about|on' in pattern else match.group(1)
+                company_name = match.group(group)
                 # Clean up the company name
                 company_name = company_name.strip()
                 # Verify that it exists in our database
-                if any(self.company_db['company_name'].str.contains(company_name, case=False, na=False)):
+                if self._is_known_company(company_name):
                     return company_name
         
         return None
@@ -150,10 +188,10 @@ class BondScreenerAgent:
         companies = []
         
         # First try to extract explicit company names
-        matches = re.findall(r'([A-Za-z\s]+?)\s+(company|limited|ltd|and|with|to)', query, re.IGNORECASE)
+        matches = _PAT_COMPANY_LIST.findall(query)
         for match in matches:
             company_name = match[0].strip()
-            if any(self.company_db['company_name'].str.contains(company_name, case=False, na=False)):
+            if self._is_known_company(company_name):
                 companies.append(company_name)
         
         # If we didn't find at least two companies, look for additional patterns
@@ -161,7 +199,7 @@ class BondScreenerAgent:
             words = query.split()
             for word in words:
                 if word not in companies and len(word) > 3:  # Avoid short words
-                    if any(self.company_db['company_name'].str.contains(word, case=False, na=False)):
+                    if self._is_known_company(word):
                         companies.append(word)
         
         return companies
@@ -1,5 +1,12 @@
 import re
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+try:
+    # google-re2 can test a whole set of patterns in one pass over the query
+    import re2
+except ImportError:
+    re2 = None
 
 class OrchestratorAgent:
     def __init__(self, specialized_agents: Dict):
@@ -11,39 +18,134 @@ class OrchestratorAgent:
         """
         self.specialized_agents = specialized_agents
         
-        # Define keywords and patterns for each agent type
-        self.agent_patterns = {
+        # Define keywords and patterns for each agent type. Each pattern comes
+        # with lowercase keywords, one of which must occur in the query for the
+        # pattern to match at all
+        routing_rules = {
             'bond_directory': [
-                r'ISIN\s+([A-Z0-9]+)',
-                r'(show|find|get|details|information).+(ISIN|bond)',
-                r'(issuer|coupon|maturity|face value|rating).*bond',
-                r'(debenture|trustee)',
-                r'(issuances|issued|bonds).+(by|from)\s+([A-Za-z\s]+)'
+                (r'ISIN\s+([A-Z0-9]+)', ('isin',)),
+                (r'(show|find|get|details|information).+(ISIN|bond)', ('show', 'find', 'get', 'details', 'information')),
+                (r'(issuer|coupon|maturity|face value|rating).*bond', ('issuer', 'coupon', 'maturity', 'face value', 'rating')),
+                (r'(debenture|trustee)', ('debenture', 'trustee')),
+                (r'(issuances|issued|bonds).+(by|from)\s+([A-Za-z\s]+)', ('issuances', 'issued', 'bonds'))
             ],
             'bond_finder': [
-                r'(available|find|where.+buy).+(bonds|yield)',
-                r'(compare|best|highest).+(yield|platform)',
-                r'(bonds|yield).+(platform|SMEST|FixedIncome)',
-                r'bond\s+finder'
+                (r'(available|find|where.+buy).+(bonds|yield)', ('bonds', 'yield')),
+                (r'(compare|best|highest).+(yield|platform)', ('compare', 'best', 'highest')),
+                (r'(bonds|yield).+(platform|SMEST|FixedIncome)', ('platform', 'smest', 'fixedincome')),
+                (r'bond\s+finder', ('finder',))
             ],
             'cash_flow': [
-                r'(cash\s+flow|payment|schedule).+(ISIN|bond)',
-                r'(maturity|maturing|redemption).+(date|in|on)',
-                r'(interest|coupon).+(payment|date)'
+                (r'(cash\s+flow|payment|schedule).+(ISIN|bond)', ('cash', 'payment', 'schedule')),
+                (r'(maturity|maturing|redemption).+(date|in|on)', ('maturity', 'maturing', 'redemption')),
+                (r'(interest|coupon).+(payment|date)', ('interest', 'coupon'))
             ],
             'bond_screener': [
-                r'(company|financial|analysis|metrics|ratio)',
-                r'(EPS|debt|equity|EBITDA|interest\s+coverage|ratio)',
-                r'(compare|pros|cons|lenders|news|rating|sector|industry)',
-                r'(current\s+ratio|growth\s+rate)'
+                (r'(company|financial|analysis|metrics|ratio)', ('company', 'financial', 'analysis', 'metrics', 'ratio')),
+                (r'(EPS|debt|equity|EBITDA|interest\s+coverage|ratio)', ('eps', 'debt', 'equity', 'ebitda', 'interest', 'ratio')),
+                (r'(compare|pros|cons|lenders|news|rating|sector|industry)', ('compare', 'pros', 'cons', 'lenders', 'news', 'rating', 'sector', 'industry')),
+                (r'(current\s+ratio|growth\s+rate)', ('ratio', 'growth'))
             ],
             'yield_calculator': [
-                r'(calculate|computation|calculation).+(yield|price|consideration)',
-                r'(clean\s+price|consideration).+(bond|ISIN)',
-                r'price\s+to\s+yield',
-                r'yield\s+to\s+price'
+                (r'(calculate|computation|calculation).+(yield|price|consideration)', ('calculate', 'computation', 'calculation')),
+                (r'(clean\s+price|consideration).+(bond|ISIN)', ('clean', 'consideration')),
+                (r'price\s+to\s+yield', ('price',)),
+                (r'yield\s+to\s+price', ('price',))
             ]
         }
+        self.agent_patterns = {
+            agent_type: [pattern for pattern, _ in rules]
+            for agent_type, rules in routing_rules.items()
+        }
+        # Keywords per built-in pattern; patterns added to agent_patterns
+        # later have none, so they are tried on every query
+        self._pattern_keywords = {
+            pattern: frozenset(keywords)
+            for rules in routing_rules.values()
+            for pattern, keywords in rules
+        }
+        
+        # Routing decision and per-agent matched pattern counts per exact query
+        # text; cleared whenever agent_patterns is recompiled
+        self._cached_route = lru_cache(maxsize=4096)(self._route_query)
+        self._compiled_from = None
+        self._compile_patterns()
+    
+    def _compile_patterns(self) -> None:
+        """
+        Compile agent_patterns into the structures routing uses
+        
+        Does nothing while agent_patterns is unchanged since the last
+        compile, so edits made after construction take effect on the next
+        query without recompiling on every one.
+        """
+        snapshot = tuple((agent_type, tuple(patterns)) for agent_type, patterns in self.agent_patterns.items())
+        if snapshot == self._compiled_from:
+            return
+        
+        # The patterns compiled once, so routing a query does not go through
+        # re's pattern cache for every one of them
+        self._compiled_patterns = {
+            agent_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for agent_type, patterns in snapshot
+        }
+        self._gated_patterns = {
+            agent_type: [(self._pattern_keywords.get(pattern.pattern), pattern) for pattern in patterns]
+            for agent_type, patterns in self._compiled_patterns.items()
+        }
+        self._keywords = frozenset().union(*(
+            keywords for gated in self._gated_patterns.values() for keywords, _ in gated if keywords is not None
+        ))
+        # With re2 installed, every pattern also goes into one re2 set; set
+        # match ids index into _pattern_ids to recover the compiled pattern.
+        # Patterns re2 cannot parse leave routing on the keyword gate.
+        self._pattern_set = None
+        if re2 is not None:
+            pattern_set = re2.Set.SearchSet(re2.Options())
+            self._pattern_ids = []
+            try:
+                for agent_type, patterns in self._compiled_patterns.items():
+                    for pattern in patterns:
+                        pattern_set.Add('(?i)' + pattern.pattern)
+                        self._pattern_ids.append((agent_type, pattern))
+                pattern_set.Compile()
+                self._pattern_set = pattern_set
+            except re2.error:
+                pass
+        
+        self._cached_route.cache_clear()
+        self._compiled_from = snapshot
+    
+    def _candidate_patterns(self, query: str) -> Dict[str, list]:
+        """
+        Compiled patterns to score the query with, by agent type
+        
+        With re2 this is only the patterns that match somewhere in the query,
+        found in a single pass; otherwise it is the patterns whose keywords
+        occur in the query. Both shortcuts need ASCII: beyond it re's case
+        folding matches more than lower() does ('İSIN' matches ISIN), and
+        re2's whitespace and case-folding rules also differ from re's.
+        """
+        if not query.isascii():
+            return self._compiled_patterns
+        
+        if self._pattern_set is None or not query.isprintable():
+            query_lower = query.lower()
+            present = {keyword for keyword in self._keywords if keyword in query_lower}
+            return {
+                agent_type: [
+                    pattern for keywords, pattern in gated
+                    if keywords is None or not keywords.isdisjoint(present)
+                ]
+                for agent_type, gated in self._gated_patterns.items()
+            }
+        
+        candidates = {agent_type: [] for agent_type in self._compiled_patterns}
+        # Match returns None rather than an empty list when nothing matches
+        for index in self._pattern_set.Match(query) or ():
+            agent_type, pattern = self._pattern_ids[index]
+            candidates[agent_type].append(pattern)
+        return candidates
     
     def determine_agent(self, query: str) -> str:
         """
@@ -55,21 +157,35 @@ class OrchestratorAgent:
         Returns:
             Agent type ('bond_directory', 'bond_finder', etc.)
         """
+        self._compile_patterns()
+        return self._cached_route(query)[0]
+    
+    def _route_query(self, query: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Score every agent type against the query and pick the highest
+        
+        Returns:
+            The chosen agent type, and how many of each agent type's patterns
+            matched the query (for _calculate_confidence)
+        """
         scores = {agent_type: 0 for agent_type in self.specialized_agents.keys()}
+        matched_patterns = {agent_type: 0 for agent_type in self._compiled_patterns}
         
         # Score each agent type based on pattern matches
-        for agent_type, patterns in self.agent_patterns.items():
+        for agent_type, patterns in self._candidate_patterns(query).items():
             for pattern in patterns:
-                matches = re.findall(pattern, query, re.IGNORECASE)
+                matches = pattern.findall(query)
                 if matches:
                     scores[agent_type] += len(matches)
+                    matched_patterns[agent_type] += 1
         
-        # Get the agent with the highest score
-        if max(scores.values()) > 0:
-            return max(scores, key=scores.get)
-        else:
-            # Default to directory for general questions
-            return 'bond_directory'
+        # Get the agent with the highest score (the first one on a tie), in a
+        # single pass; default to directory for general questions
+        best_agent, best_score = 'bond_directory', 0
+        for agent_type, score in scores.items():
+            if score > best_score:
+                best_agent, best_score = agent_type, score
+        return best_agent, matched_patterns
     
     def process_query(self, query: str) -> Dict[str, Any]:
         """
@@ -107,13 +223,10 @@ class OrchestratorAgent:
         Returns:
             Confidence score between 0 and 1
         """
-        total_patterns = sum(len(patterns) for patterns in self.agent_patterns.values())
-        agent_patterns = self.agent_patterns[agent_type]
-        
-        matches = 0
-        for pattern in agent_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
-                matches += 1
+        self._compile_patterns()
+        agent_patterns = self._compiled_patterns[agent_type]
+        # Routing already found which of the agent's patterns match the query
+        matches = self._cached_route(query)[1][agent_type]
         
         # Calculate confidence based on pattern matches
         if matches == 0: